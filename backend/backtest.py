@@ -1,9 +1,14 @@
 from typing import List, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
 import backtrader as bt
 from backtrader.comminfo import CommissionInfo
 from backtrader.feeds.pandafeed import PandasData
 from backtrader.plot import Plot_OldSync
 from datetime import datetime
+import matplotlib.pyplot as plt
+from functools import lru_cache
 import pyfolio as pf
 import pandas as pd
 import os
@@ -60,19 +65,35 @@ class CustomPlotScheme(Plot_OldSync):
         figs = super().plot(strategy, figid, numfigs, iplot, start, end, **kwargs)
 
         for i, fig in enumerate(figs):
-            width = 100
-            height = 16
-            dpi = 300
+            width = 20
+            height = 8
+            dpi = 100
             fig.set_size_inches(width, height)
             filename = "{}_chart_{}.png".format(self._directory, i)
             print("Trying to save the plot")
-            fig.savefig(filename, dpi=dpi)
+            fig.savefig(filename, dpi=dpi, bbox_inches="tight")
+            plt.close(fig)
 
     def show(self):
         print("skip the display")
         return
 
 
+BINANCE_DATA_COLUMNS = ["Open time", "Open", "High", "Low", "Close", "Volume"]
+
+
+@lru_cache(maxsize=4)
+def _read_binance_data(filename: str) -> pd.DataFrame:
+    """Parses a binance data file and caches the most recently used dataframes."""
+    if filename.endswith(".parquet"):
+        # Converted files already store "Open time" as datetime64.
+        return pd.read_parquet(filename, columns=BINANCE_DATA_COLUMNS)
+
+    data = pd.read_csv(filename, index_col=False, usecols=BINANCE_DATA_COLUMNS)
+    data["Open time"] = pd.to_datetime(data["Open time"], unit="s")
+    return data
+
+
 class Backtest:
     def __init__(
         self,
@@ -84,6 +105,8 @@ class Backtest:
         tikers: List[str] = BINANCE_TICKERS,
         strategies: List[Tuple[str, bt.Strategy]] = None,
         fractional: bool = True,
+        workers: int = None,
+        plot: bool = False,
     ) -> None:
         self.cash = cash
         self.intervals = intervals
@@ -93,6 +116,9 @@ class Backtest:
         self.commission = commission
         self.strategies = strategies
         self.fractional = fractional
+        self.workers = workers
+        self.plot = plot
+        self._comminfo = CommInfoFractional(commission=0.005) if fractional else None
 
     def _preprocessing(self, strategy, feed) -> None:
         self.cerebro = bt.Cerebro()
@@ -114,7 +140,7 @@ class Backtest:
         # Set the fractional scheme if requested
         if self.fractional:
             print("Setting the fractional scheme")
-            self.cerebro.broker.addcommissioninfo(CommInfoFractional(commission=0.005))
+            self.cerebro.broker.addcommissioninfo(self._comminfo)
 
         # Set position size
         # self.cerebro.addsizer(bt.sizers.PercentSizer, percents=100)
@@ -124,10 +150,18 @@ class Backtest:
 
     def _loading_binance_data(self, ticker, interval) -> PandasData:
         filename = os.path.join(self.path_to_data, interval, "{}.csv".format(ticker))
+        parquet_filename = os.path.splitext(filename)[0] + ".parquet"
+
+        # The parquet file is only used if the csv has not been updated since
+        # its conversion.
+        if os.path.exists(parquet_filename) and (
+            not os.path.exists(filename)
+            or os.path.getmtime(parquet_filename) >= os.path.getmtime(filename)
+        ):
+            filename = parquet_filename
 
         try:
-            data = pd.read_csv(filename, index_col=False)
-            data["Open time"] = pd.to_datetime(data["Open time"], unit="s")
+            data = _read_binance_data(filename)
             return bt.feeds.PandasData(
                 dataname=data,
                 datetime="Open time",
@@ -143,54 +177,111 @@ class Backtest:
     def run(self) -> None:
         print("Starting backtest...")
 
-        try:
-            print("Backtest {} strategies".format(len(self.strategies))) if len(
-                self.strategies
-            ) > 1 else print("Backtest {} strategies".format(len(self.strategies)))
-        except TypeError as err:
-            print("strategies list is None or empty: {}".format(err))
+        count = len(self.strategies or [])
+        print("Backtest {} strategies".format(count))
 
         saving_directory = os.path.join(
             self.path_to_save, datetime.now().strftime("%y-%m-%d-%H-%M-%S")
         )
         os.mkdir(saving_directory)
 
-        for strategy in self.strategies:
-            print("Backtesting the {} strategy".format(strategy[0]))
-            filename = "_".join(strategy[0].lower().split())
-            strategy_path = os.path.join(saving_directory, filename)
-            for interval in self.intervals:
-                print("Backtesting on {} interval".format(interval))
-                strategy_statistics_path = "_".join([strategy_path, interval])
-                for ticker in self.tickers:
-                    print(ticker)
-
-                    feed = self._loading_binance_data(ticker, interval)
-                    self._preprocessing(strategy, feed)
-                    results = self.cerebro.run()
-                    strat = results[0]
-                    pyfoliozer = strat.analyzers.getbyname("pyfolio")
-
-                    (
-                        returns,
-                        positions,
-                        transactions,
-                        gross_lev,
-                    ) = pyfoliozer.get_pf_items()
-                    print("Saving files")
-                    self._save_csv(returns, "returns", strategy_statistics_path)
-                    self._save_csv(positions, "positions", strategy_statistics_path)
-                    self._save_csv(
-                        transactions, "transactions", strategy_statistics_path
+        # All the strategies of a given (interval, ticker) are grouped in the same
+        # task so that its data is only loaded once by the worker.
+        tasks = []
+        for interval, ticker in product(self.intervals, self.tickers):
+            strategies = []
+            for strategy in self.strategies:
+                filename = "_".join(strategy[0].lower().split())
+                strategy_statistics_path = "_".join(
+                    [os.path.join(saving_directory, filename), interval]
+                )
+                strategies.append((strategy, strategy_statistics_path))
+            tasks.append((interval, ticker, strategies))
+
+        # Each (interval, ticker) backtest is independent, so they are run in
+        # separate processes and the results are saved here.
+        statistics = defaultdict(lambda: defaultdict(dict))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self._run_file, *task) for task in tasks]
+            for task, future in zip(tasks, futures):
+                interval, ticker, strategies = task
+                try:
+                    file_results = future.result()
+                except Exception as e:
+                    # A failed task must not discard the finished backtests.
+                    print("Backtest of {} on {} failed: {}".format(ticker, interval, e))
+                    continue
+
+                for (_, strategy_statistics_path), result in zip(
+                    strategies, file_results
+                ):
+                    if result is None:
+                        continue
+                    returns, positions, transactions = result
+                    results = statistics[strategy_statistics_path]
+                    results["returns"][ticker] = returns
+                    results["positions"][ticker] = positions
+                    results["transactions"][ticker] = transactions
+
+        # Each file is written once with the results of every ticker.
+        print("Saving files")
+        for strategy_statistics_path, results in statistics.items():
+            for filename, frames in results.items():
+                df = pd.concat(frames, names=["ticker"])
+                self._save_csv(df, filename, strategy_statistics_path)
+
+    def _run_file(self, interval, ticker, strategies):
+        results = []
+        for strategy, strategy_statistics_path in strategies:
+            try:
+                result = self._run_one(
+                    strategy, interval, ticker, strategy_statistics_path
+                )
+            except Exception as e:
+                print(
+                    "Backtest of the {} strategy on {} for {} failed: {}".format(
+                        strategy[0], interval, ticker, e
                     )
+                )
+                result = None
+            results.append(result)
+        return results
+
+    def _run_one(self, strategy, interval, ticker, strategy_statistics_path):
+        print(
+            "Backtesting the {} strategy on {} interval for {}".format(
+                strategy[0], interval, ticker
+            )
+        )
 
-                    pf.create_simple_tear_sheet(
-                        returns, positions=positions, transactions=transactions
-                    )
+        feed = self._loading_binance_data(ticker, interval)
+        if feed is None:
+            print("Skipping {} on {} interval".format(ticker, interval))
+            return None
+
+        self._preprocessing(strategy, feed)
+        results = self.cerebro.run()
+        strat = results[0]
+        pyfoliozer = strat.analyzers.getbyname("pyfolio")
+
+        (
+            returns,
+            positions,
+            transactions,
+            gross_lev,
+        ) = pyfoliozer.get_pf_items()
+
+        # Rendering is expensive and not needed for the statistics.
+        if self.plot:
+            pf.create_simple_tear_sheet(
+                returns, positions=positions, transactions=transactions
+            )
 
-                    self.cerebro.plot(
-                        plotter=CustomPlotScheme(strategy_statistics_path), iplot=False
-                    )
+            self.cerebro.plot(
+                plotter=CustomPlotScheme(strategy_statistics_path), iplot=False
+            )
+
+        return returns, positions, transactions
 
     def _save_csv(self, df, filename: str, directory: str) -> None:
         df.to_csv(directory + "_" + filename + ".csv")
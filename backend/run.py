@@ -7,13 +7,15 @@ PATH_TO_SAVE = "./statistics"
 STRATEGIES = [("SuperTrend", SuperTrend)]
 
 
-bt = Backtest(
-    cash=CASH,
-    tikers=["BTCUSDT"],
-    intervals=["1d"],
-    path_to_data=PATH_TO_DATA,
-    path_to_save=PATH_TO_SAVE,
-    strategies=STRATEGIES,
-)
+if __name__ == "__main__":
+    # The guard is required since the backtests are run in worker processes.
+    bt = Backtest(
+        cash=CASH,
+        tikers=["BTCUSDT"],
+        intervals=["1d"],
+        path_to_data=PATH_TO_DATA,
+        path_to_save=PATH_TO_SAVE,
+        strategies=STRATEGIES,
+    )
 
-bt.run()
+    bt.run()
@@ -12,9 +12,10 @@ class Strategy(Strategy):
       - ``order_percentage``: the percentage of our availabe cash that will be
       used to fill the order
       - ``ticker``: the ticker
+      - ``verbose``: log the executed, canceled and rejected orders
     """
 
-    params = (("name", ""), ("notifytrade", "False"))
+    params = (("name", ""), ("notifytrade", "False"), ("verbose", False))
 
     def log(self, txt, dt=None):
         """Logging function fot this strategy"""
@@ -43,22 +44,22 @@ class Strategy(Strategy):
         # Check if an order has been completed
         # Attention: broker could reject order if not enough cash
         if order.status in [order.Completed]:
-            if order.isbuy():
-                self.log(
-                    "BUY EXECUTED - Size: {} @Price: {} Value: {:.2f} Comm: {:.2f}".format(
-                        order.executed.size,
-                        order.executed.price,
-                        order.executed.value,
-                        order.executed.comm,
+            if self.p.verbose:
+                executed = order.executed
+                if order.isbuy():
+                    self.log(
+                        f"BUY EXECUTED - Size: {executed.size} "
+                        f"@Price: {executed.price} "
+                        f"Value: {executed.value:.2f} Comm: {executed.comm:.2f}"
                     )
-                )
-            elif order.issell():
-                self.log("SELL EXECUTED, %.2f" % order.executed.price)
+                elif order.issell():
+                    self.log(f"SELL EXECUTED, {executed.price:.2f}")
 
             self.bar_executed = len(self)
 
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
-            self.log("Order Canceled/Margin/Rejected")
+            if self.p.verbose:
+                self.log("Order Canceled/Margin/Rejected")
 
         # Write down: no pending order
         self.order = None
@@ -0,0 +1,46 @@
+import os
+import argparse
+import pandas as pd
+
+DIR_PATH = "./data"
+
+columns = ["Open time", "Open", "High", "Low", "Close", "Volume"]
+
+
+def convert_directory(dir_path):
+    """Converts every binance csv file under dir_path into a parquet file."""
+    for root, _, files in os.walk(dir_path):
+        for file in files:
+            if not file.endswith(".csv"):
+                continue
+            path_to_csv = os.path.join(root, file)
+            path_to_parquet = os.path.splitext(path_to_csv)[0] + ".parquet"
+            print("Converting {} to {}".format(path_to_csv, path_to_parquet))
+            try:
+                data = pd.read_csv(path_to_csv, index_col=False, usecols=columns)
+                # Stored as datetime64 so that loading does not need to parse it again.
+                data["Open time"] = pd.to_datetime(data["Open time"], unit="s")
+                data.to_parquet(path_to_parquet, compression="zstd", index=False)
+            except Exception as e:
+                print(e)
+
+
+def main(args=None):
+    args = parse_args(args)
+    convert_directory(args.dirpath)
+
+
+def parse_args(pargs=None):
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description=("Convert Binance csv data to parquet"),
+    )
+
+    parser.add_argument(
+        "--dirpath", default=DIR_PATH, required=False, help="Directory data path"
+    )
+
+    return parser.parse_args(pargs)
+
+
+main()
@@ -77,13 +77,23 @@ def screener():
     tickers = {}
 
     if pattern and interval:
+        pattern_function = getattr(talib, pattern)
         for ticker_name in ticker_names:
+            # TA-Lib only accepts double arrays, hence the explicit float64 dtype.
             df = pd.read_csv(
-                os.path.join("./data", interval, ticker_name + ".csv"), index_col=False
+                os.path.join("./data", interval, ticker_name + ".csv"),
+                index_col=False,
+                usecols=["Open", "High", "Low", "Close"],
+                dtype=np.float64,
             )
-            pattern_function = getattr(talib, pattern)
-            result = pattern_function(df["Open"], df["High"], df["Low"], df["Close"])
-            last = result.tail(1).values[0]
+            open_, high, low, close = (
+                df["Open"].to_numpy(),
+                df["High"].to_numpy(),
+                df["Low"].to_numpy(),
+                df["Close"].to_numpy(),
+            )
+            result = pattern_function(open_, high, low, close)
+            last = result[-1]
             tickers[ticker_name] = last
 
     with open("./patterns.json", "r") as f:
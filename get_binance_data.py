@@ -85,7 +85,7 @@ def update_binance_data(tickers_intervals):
             path_to_file = os.path.join(DIR_PATH, interval, f"{ticker}.csv")
             csvfile = pd.read_csv(path_to_file, index_col=False, delimiter=",")
             starting_date = datetime.utcfromtimestamp(
-                csvfile.iloc[-1]["Open time"]
+                csvfile["Open time"].iat[-1]
             ).strftime("%d %b, %Y")
             print(
                 "Getting historical data for the ticker {} with {} interval starting from {}".format(